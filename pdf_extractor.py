@@ -1,9 +1,231 @@
-from pypdf import PdfReader
-import sys
+import argparse
+import hashlib
+import json
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 
 # Methodology: Uses the assignment PDF as a real-world reference source for benchmarks
-DEFAULT_PATH = r"f:\2022BCD0028\final\Research Scientist Internship_ Take-Home Assignment.pdf"
+DEFAULT_PATH = os.environ.get(
+    'ASSIGNMENT_PDF',
+    r"f:\2022BCD0028\final\Research Scientist Internship_ Take-Home Assignment.pdf"
+)
+
+# Grounding corpus: a directory of reference PDFs whose text feeds the prompt templates
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CORPUS_DIR = os.environ.get('GROUNDING_DIR', os.path.join(BASE_DIR, 'references'))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, 'output', 'grounding_cache')
+
+# Pages are handed to worker processes in chunks so each worker opens a file once per chunk
+PAGES_PER_CHUNK = 8
+
+_STOPWORDS = {
+    'the', 'and', 'for', 'that', 'with', 'this', 'from', 'are', 'was', 'were', 'will',
+    'have', 'has', 'not', 'but', 'you', 'your', 'our', 'their', 'they', 'its', 'can',
+    'all', 'any', 'each', 'into', 'than', 'then', 'also', 'such', 'should', 'must',
+}
+
+def _tokenize(text):
+    """Lowercased keyword tokens used for both indexing and querying."""
+    return [w for w in re.findall(r"[a-z0-9][a-z0-9\-]+", text.lower())
+            if len(w) >= 3 and w not in _STOPWORDS]
+
+def _file_sha256(path):
+    """Content hash used as the cache key, so renamed or touched files are not re-parsed."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _read_json(path):
+    """Reads a cache file; a truncated or corrupt file reads as None (a cache miss)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def _write_json_atomic(path, data, **kwargs):
+    """Writes through a temp file and os.replace so an interrupted run never leaves half a file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **kwargs)
+    os.replace(tmp_path, path)
+
+def _count_pages(path):
+    from pypdf import PdfReader
+    return len(PdfReader(path).pages)
+
+def _extract_page_range(path, start, stop):
+    """Worker: extracts text for pages [start, stop) of a single PDF."""
+    from pypdf import PdfReader
+    reader = PdfReader(path)
+    return start, [(reader.pages[i].extract_text() or '') for i in range(start, stop)]
+
+class GroundingCache:
+    """
+    On-disk cache of extracted page text.
+
+    Entries are stored per content hash; a manifest maps each path to its last seen
+    (mtime, size, sha256) so unchanged files are recognised without being re-hashed.
+    Entries no longer referenced by any manifest row are deleted, so the cache does
+    not grow with every edit.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+        manifest = _read_json(self.manifest_path)
+        # Malformed rows are dropped, which simply re-hashes those files
+        self.manifest = {
+            path: seen for path, seen in (manifest.items() if isinstance(manifest, dict) else [])
+            if isinstance(seen, dict) and {'mtime', 'size', 'sha256'} <= seen.keys()
+        }
+
+    def _entry_path(self, sha256):
+        return os.path.join(self.cache_dir, f"{sha256}.json")
+
+    def _release(self, sha256):
+        """Deletes an entry file once no manifest row refers to its hash."""
+        if any(seen['sha256'] == sha256 for seen in self.manifest.values()):
+            return
+        entry = self._entry_path(sha256)
+        if os.path.exists(entry):
+            os.remove(entry)
+
+    def lookup(self, path):
+        """Returns (sha256, pages) for a cached file, or (sha256, None) when it must be parsed."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        seen = self.manifest.get(path)
+        if seen and seen['mtime'] == st.st_mtime and seen['size'] == st.st_size:
+            sha256 = seen['sha256']
+        else:
+            sha256 = _file_sha256(path)
+            self.manifest[path] = {'mtime': st.st_mtime, 'size': st.st_size, 'sha256': sha256}
+            if seen and seen['sha256'] != sha256:
+                self._release(seen['sha256'])
+
+        record = _read_json(self._entry_path(sha256))
+        if not isinstance(record, dict) or not isinstance(record.get('pages'), list):
+            return sha256, None
+        return sha256, record['pages']
+
+    def store(self, path, sha256, pages):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        _write_json_atomic(self._entry_path(sha256), {'source': os.path.abspath(path), 'pages': pages})
+
+    def save(self):
+        # Prune rows for files that have been deleted, along with their entries
+        for path in [p for p in self.manifest if not os.path.exists(p)]:
+            self._release(self.manifest.pop(path)['sha256'])
+        os.makedirs(self.cache_dir, exist_ok=True)
+        _write_json_atomic(self.manifest_path, self.manifest, indent=2)
+
+def extract_documents(paths, cache_dir=DEFAULT_CACHE_DIR, workers=None, errors=None):
+    """
+    Extracts page text for several PDFs, parsing only files missing from the cache.
+    Pages of uncached files are extracted in parallel with a process pool.
+    An unreadable document is logged and skipped (and recorded in `errors` when a
+    dict is passed) instead of failing the whole batch.
+
+    Returns:
+        dict: {path: [page_text, ...]} in the order the paths were given, minus skipped files.
+    """
+    cache = GroundingCache(cache_dir)
+    results, pending = {}, {}
+    errors = {} if errors is None else errors
+
+    def skip(path, exc):
+        if path not in errors:
+            print(f"Skipping unreadable PDF {path}: {exc}")
+            errors[path] = str(exc)
+
+    for path in paths:
+        sha256, pages = cache.lookup(path)
+        if pages is None:
+            pending[path] = sha256
+        else:
+            results[path] = pages
+
+    if pending:
+        jobs = []
+        for path in pending:
+            try:
+                n_pages = _count_pages(path)
+            except Exception as e:
+                skip(path, e)
+                continue
+            results[path] = [''] * n_pages
+            for start in range(0, n_pages, PAGES_PER_CHUNK):
+                jobs.append((path, start, min(start + PAGES_PER_CHUNK, n_pages)))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_extract_page_range, *job): job[0] for job in jobs}
+            for future, path in futures.items():
+                try:
+                    start, texts = future.result()
+                except Exception as e:
+                    skip(path, e)
+                    continue
+                results[path][start:start + len(texts)] = texts
+
+        # Failed documents are not cached, so they are retried on the next run
+        for path, sha256 in pending.items():
+            if path in errors:
+                results.pop(path, None)
+            else:
+                cache.store(path, sha256, results[path])
+
+    cache.save()
+    return {path: results[path] for path in paths if path in results}
+
+class GroundingCorpus:
+    """
+    Keyword index over the pages of a set of reference PDFs.
+    Prompt templates fill their {grounding_context} slot via `context_for()`.
+    """
+
+    def __init__(self, documents):
+        self.pages = []
+        self.index = {}
+        for path, pages in documents.items():
+            for page_no, text in enumerate(pages, start=1):
+                page_id = len(self.pages)
+                self.pages.append({'source': os.path.basename(path), 'page': page_no, 'text': text})
+                for token in set(_tokenize(text)):
+                    self.index.setdefault(token, set()).add(page_id)
+
+    def query(self, keywords, limit=3):
+        """Returns the pages matching the most distinct keywords, best first."""
+        if isinstance(keywords, str):
+            keywords = _tokenize(keywords)
+        scores = {}
+        for token in set(keywords):
+            for page_id in self.index.get(token.lower(), ()):
+                scores[page_id] = scores.get(page_id, 0) + 1
+        ranked = sorted(scores, key=lambda pid: (-scores[pid], pid))[:limit]
+        return [self.pages[pid] for pid in ranked]
+
+    def context_for(self, keywords, limit=3, max_chars=1500):
+        """Formats the best-matching pages as a grounding block for an LLM prompt."""
+        blocks = [f"[{p['source']} p.{p['page']}]\n{p['text'].strip()}" for p in self.query(keywords, limit)]
+        return '\n\n'.join(blocks)[:max_chars]
+
+def build_grounding_corpus(directory=DEFAULT_CORPUS_DIR, cache_dir=DEFAULT_CACHE_DIR, workers=None):
+    """
+    Builds a GroundingCorpus from every PDF under `directory`.
+    Unchanged documents are served from the cache and never re-parsed.
+    """
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, files in os.walk(directory)
+        for name in files if name.lower().endswith('.pdf')
+    )
+    if not paths:
+        print(f"Warning: no PDFs found under {directory}; the grounding corpus is empty")
+    return GroundingCorpus(extract_documents(paths, cache_dir=cache_dir, workers=workers))
 
 def extract_assignment_text(path=None):
     """
@@ -11,25 +233,33 @@ def extract_assignment_text(path=None):
     This ensures the generated tasks align with the 'Anatomy of Work' benchmarks.
     """
     target_path = path or DEFAULT_PATH
-    
+
     if not os.path.exists(target_path):
         return f"Warning: Assignment PDF not found at {target_path}"
 
     try:
-        reader = PdfReader(target_path)
-        text_content = []
-        
-        for page in reader.pages:
-            # Extracting text from each page for keyword analysis
-            page_text = page.extract_text() or ''
-            text_content.append(page_text)
-
-        return '\n\n'.join(text_content)
+        # Served from the grounding cache when the file has not changed
+        errors = {}
+        pages = extract_documents([target_path], errors=errors).get(target_path)
+        if pages is None:
+            return f"Error reading PDF: {errors.get(target_path)}"
+        return '\n\n'.join(pages)
     except Exception as e:
         return f"Error reading PDF: {str(e)}"
 
 if __name__ == "__main__":
     # Allow command line overrides for different document paths
-    pdf_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
-    content = extract_assignment_text(pdf_path)
-    print(content)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Extract grounding text from reference PDFs")
+    parser.add_argument('path', nargs='?', default=DEFAULT_PATH,
+                        help='A single PDF, or a directory of PDFs to index')
+    parser.add_argument('--query', type=str, help='Keywords to look up in a directory corpus')
+    parser.add_argument('--workers', type=int, default=None, help='Extraction worker processes')
+    args = parser.parse_args()
+
+    if os.path.isdir(args.path):
+        corpus = build_grounding_corpus(args.path, workers=args.workers)
+        print(f"Indexed {len(corpus.pages)} pages, {len(corpus.index)} keywords")
+        if args.query:
+            print(corpus.context_for(args.query))
+    else:
+        print(extract_assignment_text(args.path))
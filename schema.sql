@@ -7,7 +7,8 @@ CREATE TABLE `organizations` (
 CREATE TABLE `teams` (
   `team_id` text PRIMARY KEY,
   `org_id` text NOT NULL,
-  `name` text NOT NULL
+  `name` text NOT NULL,
+  FOREIGN KEY (`org_id`) REFERENCES `organizations` (`org_id`)
 );
 
 CREATE TABLE `users` (
@@ -15,26 +16,33 @@ CREATE TABLE `users` (
   `org_id` text NOT NULL,
   `full_name` text NOT NULL,
   `email` text UNIQUE NOT NULL,
-  `role` text NOT NULL
+  `role` text NOT NULL,
+  `created_at` timestamp,
+  FOREIGN KEY (`org_id`) REFERENCES `organizations` (`org_id`)
 );
 
 CREATE TABLE `team_memberships` (
   `team_id` text,
   `user_id` text,
-  PRIMARY KEY (`team_id`, `user_id`)
+  PRIMARY KEY (`team_id`, `user_id`),
+  FOREIGN KEY (`team_id`) REFERENCES `teams` (`team_id`),
+  FOREIGN KEY (`user_id`) REFERENCES `users` (`user_id`)
 );
 
 CREATE TABLE `projects` (
   `project_id` text PRIMARY KEY,
   `team_id` text NOT NULL,
   `name` text NOT NULL,
-  `created_at` timestamp
+  `description` text,
+  `created_at` timestamp,
+  FOREIGN KEY (`team_id`) REFERENCES `teams` (`team_id`)
 );
 
 CREATE TABLE `sections` (
   `section_id` text PRIMARY KEY,
   `project_id` text NOT NULL,
-  `name` text NOT NULL
+  `name` text NOT NULL,
+  FOREIGN KEY (`project_id`) REFERENCES `projects` (`project_id`)
 );
 
 CREATE TABLE `tasks` (
@@ -48,25 +56,55 @@ CREATE TABLE `tasks` (
   `due_date` date,
   `completed` boolean,
   `created_at` timestamp,
-  `completed_at` timestamp
+  `completed_at` timestamp,
+  FOREIGN KEY (`project_id`) REFERENCES `projects` (`project_id`),
+  FOREIGN KEY (`section_id`) REFERENCES `sections` (`section_id`),
+  FOREIGN KEY (`assignee_id`) REFERENCES `users` (`user_id`),
+  FOREIGN KEY (`parent_task_id`) REFERENCES `tasks` (`task_id`)
 );
 
 CREATE TABLE `tags` (
   `tag_id` text PRIMARY KEY,
-  `name` text NOT NULL
+  `org_id` text NOT NULL,
+  `name` text NOT NULL,
+  FOREIGN KEY (`org_id`) REFERENCES `organizations` (`org_id`)
 );
 
 CREATE TABLE `task_tags` (
   `task_id` text,
   `tag_id` text,
-  PRIMARY KEY (`task_id`, `tag_id`)
+  PRIMARY KEY (`task_id`, `tag_id`),
+  FOREIGN KEY (`task_id`) REFERENCES `tasks` (`task_id`),
+  FOREIGN KEY (`tag_id`) REFERENCES `tags` (`tag_id`)
+);
+
+CREATE TABLE `comments` (
+  `comment_id` text PRIMARY KEY,
+  `task_id` text NOT NULL,
+  `user_id` text NOT NULL,
+  `body` text NOT NULL,
+  `created_at` timestamp,
+  FOREIGN KEY (`task_id`) REFERENCES `tasks` (`task_id`),
+  FOREIGN KEY (`user_id`) REFERENCES `users` (`user_id`)
+);
+
+CREATE TABLE `attachments` (
+  `attachment_id` text PRIMARY KEY,
+  `task_id` text NOT NULL,
+  `filename` text NOT NULL,
+  `url` text NOT NULL,
+  `uploaded_by` text,
+  `created_at` timestamp,
+  FOREIGN KEY (`task_id`) REFERENCES `tasks` (`task_id`),
+  FOREIGN KEY (`uploaded_by`) REFERENCES `users` (`user_id`)
 );
 
 CREATE TABLE `custom_field_definitions` (
   `field_id` text PRIMARY KEY,
   `org_id` text NOT NULL,
   `name` text NOT NULL,
-  `type` text NOT NULL
+  `type` text NOT NULL,
+  FOREIGN KEY (`org_id`) REFERENCES `organizations` (`org_id`)
 );
 
 CREATE TABLE `custom_field_values` (
@@ -74,35 +112,7 @@ CREATE TABLE `custom_field_values` (
   `task_id` text NOT NULL,
   `field_id` text NOT NULL,
   `text_value` text,
-  `number_value` float
+  `number_value` float,
+  FOREIGN KEY (`task_id`) REFERENCES `tasks` (`task_id`),
+  FOREIGN KEY (`field_id`) REFERENCES `custom_field_definitions` (`field_id`)
 );
-
-ALTER TABLE `teams` ADD FOREIGN KEY (`org_id`) REFERENCES `organizations` (`org_id`);
-
-ALTER TABLE `users` ADD FOREIGN KEY (`org_id`) REFERENCES `organizations` (`org_id`);
-
-ALTER TABLE `team_memberships` ADD FOREIGN KEY (`team_id`) REFERENCES `teams` (`team_id`);
-
-ALTER TABLE `team_memberships` ADD FOREIGN KEY (`user_id`) REFERENCES `users` (`user_id`);
-
-ALTER TABLE `projects` ADD FOREIGN KEY (`team_id`) REFERENCES `teams` (`team_id`);
-
-ALTER TABLE `sections` ADD FOREIGN KEY (`project_id`) REFERENCES `projects` (`project_id`);
-
-ALTER TABLE `tasks` ADD FOREIGN KEY (`project_id`) REFERENCES `projects` (`project_id`);
-
-ALTER TABLE `tasks` ADD FOREIGN KEY (`section_id`) REFERENCES `sections` (`section_id`);
-
-ALTER TABLE `tasks` ADD FOREIGN KEY (`assignee_id`) REFERENCES `users` (`user_id`);
-
-ALTER TABLE `tasks` ADD FOREIGN KEY (`parent_task_id`) REFERENCES `tasks` (`task_id`);
-
-ALTER TABLE `task_tags` ADD FOREIGN KEY (`task_id`) REFERENCES `tasks` (`task_id`);
-
-ALTER TABLE `task_tags` ADD FOREIGN KEY (`tag_id`) REFERENCES `tags` (`tag_id`);
-
-ALTER TABLE `custom_field_definitions` ADD FOREIGN KEY (`org_id`) REFERENCES `organizations` (`org_id`);
-
-ALTER TABLE `custom_field_values` ADD FOREIGN KEY (`task_id`) REFERENCES `tasks` (`task_id`);
-
-ALTER TABLE `custom_field_values` ADD FOREIGN KEY (`field_id`) REFERENCES `custom_field_definitions` (`field_id`);
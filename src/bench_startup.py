@@ -0,0 +1,84 @@
+import argparse
+import os
+import shutil
+import statistics
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+# Measures cold-start wall time of the short CLI paths in fresh interpreters.
+# Each case runs in its own subprocess so module caches never carry over.
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(SRC_DIR)
+
+CASES = {
+    'main.py --help': [os.path.join(SRC_DIR, 'main.py'), '--help'],
+    'import generators': ['-c', 'import generators'],
+    'load generator modules': ['-c', 'from generators import generate_organization, generate_metadata, generate_tasks'],
+    'import pdf_extractor': ['-c', 'import pdf_extractor'],
+}
+
+def _env():
+    """Child environment with both src/ and the repo root importable."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([SRC_DIR, BASE_DIR, env.get('PYTHONPATH', '')])
+    return env
+
+def time_case(argv, runs):
+    """Returns the per-run wall times (seconds) for `python <argv>`."""
+    env = _env()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def heavy_modules_loaded(statement):
+    """Lists heavy third-party modules pulled in by a Python statement."""
+    heavy = ('faker', 'pandas', 'pypdf', 'requests', 'dotenv')
+    probe = (f"import sys; {statement}; "
+             f"print(','.join(m for m in {heavy!r} if m in sys.modules))")
+    env = _env()
+    out = subprocess.run([sys.executable, '-c', probe], env=env, check=True,
+                         capture_output=True, text=True).stdout.strip()
+    return [m for m in out.split(',') if m]
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup-time benchmark for the short CLI paths")
+    parser.add_argument('--runs', type=int, default=5, help='Runs per case (median is reported)')
+    parser.add_argument('--budget', type=float, default=1.0,
+                        help='Fail if any median exceeds this many seconds')
+    args = parser.parse_args()
+
+    # Validate-only runs against an empty, schema-initialised database
+    tmp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(tmp_dir, 'bench.sqlite')
+    conn = sqlite3.connect(db_path)
+    with open(os.path.join(BASE_DIR, 'schema.sql'), 'r', encoding='utf-8') as f:
+        conn.executescript(f.read())
+    conn.close()
+    cases = dict(CASES)
+    cases['main.py --validate-only'] = [os.path.join(SRC_DIR, 'main.py'), '--validate-only', '--db', db_path]
+
+    failed = False
+    for label, argv in cases.items():
+        median = statistics.median(time_case(argv, args.runs))
+        status = 'ok' if median <= args.budget else 'SLOW'
+        failed |= median > args.budget
+        print(f"{label:<28} median {median * 1000:7.1f} ms  [{status}]")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # Importing the package must not eagerly load any heavy dependency
+    leaked = heavy_modules_loaded('import generators, generators.tasks, generators.teams_projects, pdf_extractor')
+    if leaked:
+        print(f"Heavy modules loaded at import time: {', '.join(leaked)}")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,20 @@
 """
 Package initialization for the Asana Seed Data Generator.
 Exposes the core orchestration functions for users, projects, and tasks.
+
+Submodules are imported on first attribute access so that `import generators`
+stays cheap for short CLI invocations (e.g. `--help`).
 """
 
-from .users import generate_users
-from .teams_projects import generate_organization
-from .projects import generate_projects
-from .tasks import generate_tasks
-from .metadata import generate_metadata
+import importlib
+
+_EXPORTS = {
+    "generate_users": ".users",
+    "generate_organization": ".teams_projects",
+    "generate_projects": ".projects",
+    "generate_tasks": ".tasks",
+    "generate_metadata": ".metadata",
+}
 
 __all__ = [
     "generate_users",
@@ -15,4 +22,12 @@ __all__ = [
     "generate_projects",
     "generate_tasks",
     "generate_metadata"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Resolves exported generator functions lazily (PEP 562)."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Shared Faker instance for the generator package.
+
+Building a Faker() loads every provider for the default locale, which is the
+slowest part of importing the generators. All modules call get_fake() instead
+of creating their own instance, so the cost is paid once and only when data is
+actually generated.
+"""
+
+_fake = None
+
+def get_fake():
+    """Returns the process-wide Faker instance, creating it on first use."""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+    return _fake
@@ -1,9 +1,41 @@
-from faker import Faker
+import os
 import random
+import re
+from functools import lru_cache
+from ._fake import get_fake
 
-fake = Faker()
+PROMPTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'prompts', 'llm_prompts.md'
+)
+
+@lru_cache(maxsize=None)
+def load_prompt_template(title):
+    """
+    Reads a template from prompts/llm_prompts.md by its section title
+    (e.g. "Task Description Generator"), so the markdown stays the single source.
+    """
+    with open(PROMPTS_PATH, 'r', encoding='utf-8') as f:
+        text = f.read()
+    section = re.search(rf"^## \d+\. {re.escape(title)}\s*$(.*?)(?=^## |\Z)", text, re.M | re.S)
+    if section is None:
+        raise KeyError(f"No prompt template titled {title!r} in {PROMPTS_PATH}")
+    quoted = [re.sub(r"^>\s?", "", line) for line in section.group(1).splitlines() if line.startswith('>')]
+    return "\n".join(quoted).strip().strip('"').strip()
+
+def render_prompt(title, grounding=None, **values):
+    """
+    Fills a template's variables; {grounding_context} is answered by querying the
+    GroundingCorpus with the other values as keywords (empty without a corpus).
+    """
+    template = load_prompt_template(title)
+    if '{grounding_context}' in template:
+        keywords = " ".join(str(v) for v in values.values())
+        values['grounding_context'] = grounding.context_for(keywords) if grounding is not None else ""
+    return template.format(**values)
 
 def generate_task_title():
+    fake = get_fake()
     # Mimics professional task naming conventions
     prefixes = ['Update', 'Implement', 'Fix', 'Refactor', 'Research']
     subjects = ['API', 'UI Module', 'Database Schema', 'Auth Flow', 'Documentation']
@@ -15,7 +47,13 @@ def generate_task_title():
     ])
     return template
 
-def generate_task_body():
+def generate_task_body(prompt=None):
+    """
+    Offline stand-in for the description LLM call. `prompt` is the rendered
+    "Task Description Generator" template a real backend would send; the stub
+    answers with Faker text and never copies grounding excerpts into the data.
+    """
+    fake = get_fake()
     # Generates tiered complexity for task descriptions
     chance = random.random()
     
@@ -1,9 +1,6 @@
 import sqlite3
 import uuid
 import random
-from faker import Faker
-
-fake = Faker()
 
 def _uid():
     """Generates a UUIDv4 string for unique primary keys."""
@@ -30,31 +27,27 @@ def generate_metadata(conn: sqlite3.Connection, org_struct: dict):
 
     # 2. Create Project-specific Custom Field Definitions
     # Design Decision: Implements the EAV model metadata for varying project needs.
+    # Definitions are org-scoped in the schema, so the org's field set is created once.
+    # Field types restricted to text, number, or enum as per schema requirements.
+    field_set = [('Priority', 'enum'), ('Story Points', 'number'), ('T-Shirt Size', 'enum'),
+                 ('Reviewer', 'text'), ('Department', 'text')]
+    definitions = []
+    for field_name, field_type in field_set:
+        field_id = _uid()
+        cur.execute('''
+            INSERT INTO custom_field_definitions(field_id, org_id, name, type) 
+            VALUES (?,?,?,?)
+        ''', (field_id, org_id, field_name, field_type))
+        definitions.append({'field_id': field_id, 'name': field_name, 'field_type': field_type})
+
     custom_fields = []
     
     # Iterate through projects created in the teams_projects generator
     for proj in org_struct.get('projects', []):
-        # Distribution: 0-3 custom fields per project to simulate realistic workspace variety.
-        num_defs = random.randint(0, 3)
-        
-        for _ in range(num_defs):
-            field_id = _uid()
-            # Generate realistic field names like 'Priority', 'Effort', or 'Sprint'
-            field_name = random.choice(['Priority', 'Story Points', 'T-Shirt Size', 'Reviewer', 'Department'])
-            # Field types restricted to text, number, or enum as per schema requirements.
-            field_type = random.choice(['text', 'number', 'enum'])
-            
-            cur.execute('''
-                INSERT INTO custom_field_defs(field_id, project_id, name, field_type) 
-                VALUES (?,?,?,?)
-            ''', (field_id, proj['project_id'], field_name, field_type))
-            
-            custom_fields.append({
-                'field_id': field_id, 
-                'project_id': proj['project_id'], 
-                'name': field_name, 
-                'field_type': field_type
-            })
+        # Distribution: 0-3 of the org's fields per project to simulate realistic workspace variety.
+        # The project link is kept in memory; values reference the shared definitions.
+        for d in random.sample(definitions, random.randint(0, 3)):
+            custom_fields.append(dict(d, project_id=proj['project_id']))
 
     conn.commit()
     
@@ -7,7 +7,7 @@ Some consumers expect a `generators.projects` module. This file delegates to
 
 from .teams_projects import generate_organization
 
-def generate_projects(conn, num_users=5000):
+def generate_projects(conn, num_users=5000, reference=None):
     """
     Creates an organization structure including teams, users, projects, and sections.
     
@@ -17,9 +17,10 @@ def generate_projects(conn, num_users=5000):
     Args:
         conn: sqlite3.Connection object.
         num_users: Target number of users for the simulation (default 5000).
+        reference: Optional reference data from scrapers.reference_data.
         
     Returns:
         dict: The generated organization structure containing IDs for teams and projects.
     """
     # Simply calls the authoritative generator from teams_projects.py
-    return generate_organization(conn, num_users=num_users)
\ No newline at end of file
+    return generate_organization(conn, num_users=num_users, reference=reference)
\ No newline at end of file
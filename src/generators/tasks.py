@@ -1,11 +1,9 @@
 import sqlite3
 import uuid
 import random
-from faker import Faker
 from datetime import datetime, timedelta
-from .llm_stub import generate_task_name, generate_description
-
-fake = Faker()
+from ._fake import get_fake
+from .llm_stub import generate_task_title, generate_task_body, render_prompt
 
 def _uid():
     """Generates a UUIDv4 string for unique primary keys."""
@@ -31,11 +29,18 @@ def generate_tasks(conn: sqlite3.Connection, org_struct: dict, density=1.0):
     Generates realistic tasks and related artifacts (comments, tags, custom fields).
     Enforces benchmarks: 15% unassigned tasks and temporal consistency.
     """
+    fake = get_fake()
     cur = conn.cursor()
     projects = org_struct.get('projects', [])
     tags = org_struct.get('tags', [])
-    custom_fields = org_struct.get('custom_fields', [])
+    grounding = org_struct.get('grounding')
+    team_names = {t['team_id']: t['name'] for t in org_struct.get('teams', [])}
+    fields_by_project = {}
+    for cf in org_struct.get('custom_fields', []):
+        fields_by_project.setdefault(cf['project_id'], []).append(cf)
     now = datetime.utcnow()
+    # Join dates bound when a user's tasks, comments and attachments can start
+    user_created = {u['user_id']: u['created_at'] for u in org_struct.get('users', [])}
 
     for p in projects:
         # Scale task count based on project density and randomization
@@ -49,8 +54,14 @@ def generate_tasks(conn: sqlite3.Connection, org_struct: dict, density=1.0):
             task_id = _uid()
             
             # Methodology: LLM-generated names and descriptions to avoid generic text
-            name = generate_task_name()
-            desc = generate_description(name)
+            name = generate_task_title()
+            # Grounding only shapes the prompt; it is never written into the dataset
+            prompt = None
+            if grounding is not None:
+                prompt = render_prompt('Task Description Generator', grounding,
+                                       task_name=name, project_type=team_names.get(p['team_id'], ''),
+                                       project_context=p.get('name', ''))
+            desc = generate_task_body(prompt)
             
             section = random.choice(sections) if sections else (None, None)
             section_id = section[0]
@@ -58,8 +69,11 @@ def generate_tasks(conn: sqlite3.Connection, org_struct: dict, density=1.0):
             # Benchmark: 85% assigned probability (15% unassigned per industry norms)
             assignee = _choose_assignee(conn, p['team_id']) if random.randint(1, 100) <= 85 else None
             
-            # Temporal Logic: Task creation over a 2-year history
-            created = now - timedelta(days=random.randint(0, 720))
+            # Temporal Logic: Tasks are created after both the project and the assignee exist
+            floor = p['created_at']
+            if assignee in user_created:
+                floor = max(floor, user_created[assignee])
+            created = floor + timedelta(seconds=random.uniform(0, max(0.0, (now - floor).total_seconds())))
             
             # Due Date Heuristics: 90% have due dates, skewed toward the future relative to creation
             due = None
@@ -74,7 +88,7 @@ def generate_tasks(conn: sqlite3.Connection, org_struct: dict, density=1.0):
                 # Logical Constraint: completed_at MUST be after created_at
                 completed_at = created + timedelta(days=random.randint(0, 60))
                 if completed_at > now:
-                    completed_at = now - timedelta(minutes=random.randint(1, 60))
+                    completed_at = max(created, now - timedelta(minutes=random.randint(1, 60)))
 
             cur.execute('''
                 INSERT INTO tasks(
@@ -101,18 +115,23 @@ def generate_tasks(conn: sqlite3.Connection, org_struct: dict, density=1.0):
                 cur.execute('''
                     INSERT INTO comments(comment_id, task_id, user_id, body, created_at) 
                     VALUES (?,?,?,?,?)
-                ''', (_uid(), task_id, assignee, fake.sentence(), (created + timedelta(days=1)).isoformat()))
+                ''', (_uid(), task_id, assignee, fake.sentence(), min(created + timedelta(days=1), now).isoformat()))
 
             # Relational Metadata: Assign org-level tags (35% probability)
             if tags and random.randint(1, 100) <= 35:
                 t = random.choice(tags)
-                cur.execute('INSERT INTO task_tags(id, task_id, tag_id) VALUES (?,?,?)', (_uid(), task_id, t['tag_id']))
+                cur.execute('INSERT INTO task_tags(task_id, tag_id) VALUES (?,?)', (task_id, t['tag_id']))
 
             # Custom Field Values: Map field-specific values to tasks
-            for cf in [c for c in custom_fields if c['project_id'] == p['project_id']]:
-                val = str(random.randint(1, 100)) if cf['field_type'] == 'number' else fake.word()
-                cur.execute('INSERT INTO custom_field_values(value_id, field_id, task_id, value) VALUES (?,?,?,?)', 
-                            (_uid(), cf['field_id'], task_id, val))
+            for cf in fields_by_project.get(p['project_id'], []):
+                if cf['field_type'] == 'number':
+                    text_val, number_val = None, float(random.randint(1, 100))
+                else:
+                    text_val, number_val = fake.word(), None
+                cur.execute('''
+                    INSERT INTO custom_field_values(value_id, field_id, task_id, text_value, number_value) 
+                    VALUES (?,?,?,?,?)
+                ''', (_uid(), cf['field_id'], task_id, text_val, number_val))
 
             # Artifacts: 10% of tasks have attachments
             if random.randint(1, 100) <= 10:
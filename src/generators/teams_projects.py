@@ -1,29 +1,45 @@
 import sqlite3
 import uuid
 import random
-from faker import Faker
+import re
+import unicodedata
 from datetime import datetime, timedelta
 from itertools import cycle
+from ._fake import get_fake
 from .users import generate_users
 
-fake = Faker()
-
 def _uid():
     """Generates a UUIDv4 string for primary keys."""
     return str(uuid.uuid4())
 
-def generate_organization(conn: sqlite3.Connection, num_users: int = 5000):
+def _domain_for(org_name: str, org_id: str):
+    """
+    Builds an email-safe domain from the first word of the organization name.
+    Scraped names may contain apostrophes, dots or non-ASCII characters, so only
+    [a-z0-9-] is kept, falling back to an id-based slug when nothing is left.
+    """
+    first = org_name.split()[0] if org_name.split() else ''
+    ascii_name = unicodedata.normalize('NFKD', first).encode('ascii', 'ignore').decode('ascii')
+    label = re.sub(r'[^a-z0-9-]', '', ascii_name.lower()).strip('-')
+    return f"{label or 'org-' + org_id[:8]}.com"
+
+def generate_organization(conn: sqlite3.Connection, num_users: int = 5000, reference: dict = None):
     """
     Orchestrates the creation of the top-level organization, teams, users, 
     memberships, and projects.
+    `reference` is the dict from scrapers.reference_data.load_reference_data(); when
+    omitted, names fall back to Faker.
     """
+    reference = reference or {}
+    fake = get_fake()
     cur = conn.cursor()
     
     # 1. Create Organization
     org_id = _uid()
-    org_name = fake.company() + ' Inc.'
+    companies = reference.get('companies')
+    org_name = (random.choice(companies) if companies else fake.company()) + ' Inc.'
     # Generate a clean domain for professional email addresses
-    domain = org_name.split()[0].lower().replace(',', '') + ".com"
+    domain = _domain_for(org_name, org_id)
     
     cur.execute('''
         INSERT INTO organizations(org_id, name, domain) 
@@ -34,11 +50,17 @@ def generate_organization(conn: sqlite3.Connection, num_users: int = 5000):
     avg_team_size = 10
     num_teams = max(3, num_users // avg_team_size)
     teams = []
+    taxonomy = reference.get('teams')
     
-    for _ in range(num_teams):
+    for i in range(num_teams):
         team_id = _uid()
-        # Use business jargon to create realistic team names
-        team_name = fake.bs().title()[:40]
+        if taxonomy:
+            # Cycle the team taxonomy, numbering repeats (e.g. "Growth Marketing 2")
+            base, rep = taxonomy[i % len(taxonomy)], i // len(taxonomy) + 1
+            team_name = base if rep == 1 else f"{base} {rep}"
+        else:
+            # Use business jargon to create realistic team names
+            team_name = fake.bs().title()[:40]
         cur.execute('''
             INSERT INTO teams(team_id, org_id, name) 
             VALUES (?,?,?)
@@ -47,7 +69,7 @@ def generate_organization(conn: sqlite3.Connection, num_users: int = 5000):
 
     # 3. Generate Users (Calls the users.py generator)
     # Passes the generated domain to ensure consistent email addresses
-    users = generate_users(conn, org_id, num_users, domain)
+    users = generate_users(conn, org_id, num_users, domain, job_titles=reference.get('job_titles'))
 
     # 4. Create Team Memberships (Round-robin assignment)
     team_cycle = cycle(teams)
@@ -89,6 +111,7 @@ def generate_organization(conn: sqlite3.Connection, num_users: int = 5000):
             projects.append({
                 'project_id': project_id, 
                 'team_id': t['team_id'],
+                'name': project_name,
                 'created_at': created_at
             })
 
@@ -1,21 +1,20 @@
 import sqlite3
 import uuid
 import random
-from faker import Faker
 from datetime import datetime, timedelta
-
-# Initialize Faker with localized data for realistic distribution
-fake = Faker()
+from ._fake import get_fake
 
 def _uid():
     """Generates a UUIDv4 string to simulate Asana's GID format."""
     return str(uuid.uuid4())
 
-def generate_users(conn: sqlite3.Connection, org_id: str, num_users: int, domain: str):
+def generate_users(conn: sqlite3.Connection, org_id: str, num_users: int, domain: str, job_titles: list = None):
     """
     Generates realistic user data for a B2B SaaS organization.
     Ensures unique emails, job-based roles, and temporal consistency.
+    Job titles are drawn from the scraped reference list when given, otherwise from Faker.
     """
+    fake = get_fake()
     cur = conn.cursor()
     users = []
     
@@ -24,6 +23,7 @@ def generate_users(conn: sqlite3.Connection, org_id: str, num_users: int, domain
     
     # Enterprise role distribution for simulation realism
     roles = ['member'] * 85 + ['admin'] * 5 + ['guest'] * 10
+    seen_emails = set()
 
     for _ in range(num_users):
         user_id = _uid()
@@ -33,12 +33,18 @@ def generate_users(conn: sqlite3.Connection, org_id: str, num_users: int, domain
         # Example: john.doe@company.com
         clean_name = "".join(filter(str.isalnum, full_name.lower().replace(" ", ".")))
         email = f"{clean_name}@{domain}"
+        # Disambiguate name collisions so the UNIQUE email constraint holds
+        suffix = 1
+        while email in seen_emails:
+            suffix += 1
+            email = f"{clean_name}{suffix}@{domain}"
+        seen_emails.add(email)
         
         # Methodology: Roles follow specific industry distributions
         role_type = random.choice(roles)
         
-        # Methodology: faker.job() mimics varied seniority and job titles
-        job_title = fake.job()
+        # Methodology: reference titles (or faker.job()) mimic varied seniority and job titles
+        job_title = random.choice(job_titles) if job_titles else fake.job()
         
         # Methodology: Sampling over 6-12 month history with weekday bias
         # Adding a random number of days to the start_date
@@ -65,7 +71,8 @@ def generate_users(conn: sqlite3.Connection, org_id: str, num_users: int, domain
             'user_id': user_id, 
             'email': email, 
             'full_name': full_name,
-            'role': role_type
+            'role': role_type,
+            'created_at': creation_dt
         })
 
     return users
\ No newline at end of file
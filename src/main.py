@@ -1,37 +1,107 @@
 import argparse
 import sqlite3
 import os
-from dotenv import load_dotenv
+import sys
 
-# [cite_start]Import the modular generator functions [cite: 74, 76]
-from generators.users import generate_users
-from generators.teams_projects import generate_organization
-from generators.tasks import generate_tasks
-from generators.metadata import generate_metadata
+# Generator modules (and Faker/dotenv) are imported inside main() after argument
+# parsing, so `--help` and other short invocations only pay for the stdlib.
 
 # [cite_start]Define directory structure according to assignment requirements [cite: 61, 84]
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_DIR = os.path.join(BASE_DIR, 'output')
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# The repository root hosts top-level modules such as pdf_extractor; appended so it
+# never shadows packages under src/
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
 
 def load_schema(conn, schema_path):
-    [cite_start]"""Executes the DDL script to initialize the SQLite database[cite: 71, 92]."""
+    """Executes the DDL script to initialize the SQLite database [cite: 71, 92]."""
     with open(schema_path, 'r', encoding='utf-8') as f:
         conn.executescript(f.read())
 
+def report_errors(stage, errors):
+    """Prints validation errors for a stage; returns True when the stage passed."""
+    if not errors:
+        print(f"{stage}: OK")
+        return True
+    print(f"{stage}: {len(errors)} problem(s)")
+    for e in errors:
+        print(f"  - {e}")
+    return False
+
+def validate_database(conn):
+    """Runs the post-load integrity pass and prints the benchmark metrics."""
+    from validators import run_integrity_checks
+    result = run_integrity_checks(conn)
+    m = result['metrics']
+    if 'unassigned_rate' in m:
+        print(f"Unassigned rate: {m['unassigned_rate']:.1%}, completion rate: {m['completion_rate']:.1%}")
+    return report_errors('Integrity checks', result['errors'])
+
 def main():
     # [cite_start]Setup argument parser for external configuration of database size [cite: 96]
     parser = argparse.ArgumentParser(description="Asana RL Seed Data Generator")
     parser.add_argument('--users', type=int, default=5000, 
-                        [cite_start]help='Number of users to generate (target: 5000-10000) [cite: 24]')
+                        help='Number of users to generate (target: 5000-10000)')
     parser.add_argument('--db', type=str, 
                         default=os.path.join(OUTPUT_DIR, 'asana_simulation.sqlite'),
-                        [cite_start]help='Path to the final SQLite database [cite: 88]')
+                        help='Path to the final SQLite database')
+    parser.add_argument('--grounding-dir', type=str, default=None,
+                        help='Directory of reference PDFs used as LLM prompt grounding')
+    parser.add_argument('--offline', action='store_true',
+                        help='Use cached or bundled fixture reference data; never hit the network')
+    parser.add_argument('--refresh-reference', action='store_true',
+                        help='Re-fetch reference data instead of using the on-disk cache')
+    parser.add_argument('--validate-only', action='store_true',
+                        help='Validate the existing database without regenerating it')
     args = parser.parse_args()
 
+    # [cite_start]Load the relational schema [cite: 28, 29]
+    schema_path = os.path.join(BASE_DIR, 'schema.sql')
+    if not os.path.exists(schema_path):
+        print(f"Error: schema.sql not found at {schema_path}")
+        sys.exit(1)
+
+    # Pre-flight: every generator INSERT must conform to schema.sql before any row is written
+    from validators import check_generator_inserts
+    if not report_errors('Schema conformance', check_generator_inserts(schema_path)):
+        sys.exit(1)
+
+    if args.validate_only:
+        if not os.path.exists(args.db):
+            print(f"Error: database not found at {args.db}")
+            sys.exit(1)
+        conn = sqlite3.connect(args.db)
+        ok = validate_database(conn)
+        conn.close()
+        sys.exit(0 if ok else 1)
+
     # [cite_start]Load environment variables for LLM API keys [cite: 96]
+    from dotenv import load_dotenv
     load_dotenv()
 
+    # [cite_start]Import the modular generator functions [cite: 74, 76]
+    from generators import generate_organization, generate_metadata, generate_tasks
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # Reference data (companies, job titles, team taxonomy) is loaded once, before generation,
+    # so no generator touches the network
+    from scrapers.reference_data import load_reference_data
+    reference = load_reference_data(offline=args.offline, refresh=args.refresh_reference)
+
+    # Grounding corpus for prompt templates, built before the database is touched so a
+    # failure cannot leave a half-written dataset; unchanged PDFs are served from the cache
+    grounding = None
+    if args.grounding_dir:
+        if not os.path.isdir(args.grounding_dir):
+            print(f"Error: grounding directory not found at {args.grounding_dir}")
+            sys.exit(1)
+        from pdf_extractor import build_grounding_corpus
+        grounding = build_grounding_corpus(args.grounding_dir)
+        print(f"Loaded grounding corpus: {len(grounding.pages)} pages")
+
     # Initialize fresh database to ensure a clean simulation run
     db_path = args.db
     if os.path.exists(db_path):
@@ -41,18 +111,15 @@ def main():
     conn = sqlite3.connect(db_path)
     conn.execute('PRAGMA foreign_keys = ON;')
 
-    # [cite_start]Load the relational schema [cite: 28, 29]
-    schema_path = os.path.join(BASE_DIR, 'schema.sql')
-    if not os.path.exists(schema_path):
-        print(f"Error: schema.sql not found at {schema_path}")
-        return
     load_schema(conn, schema_path)
 
     print(f"Starting simulation for {args.users} users...")
 
     # [cite_start]Phase 1: Core Organization Structure [cite: 21, 32]
     # Creates Organizations, Teams, Projects, and Users
-    org_context = generate_organization(conn, num_users=args.users)
+    org_context = generate_organization(conn, num_users=args.users, reference=reference)
+
+    org_context['grounding'] = grounding
 
     # [cite_start]Phase 2: Metadata Generation [cite: 21, 32]
     # Generates Tags and Custom Field Definitions (Priority, Status, etc.)
@@ -65,9 +132,14 @@ def main():
 
     # [cite_start]Commit changes and finalize the .sqlite file [cite: 97, 98]
     conn.commit()
+
+    # Post-load: set-based orphan, temporal and benchmark checks
+    ok = validate_database(conn)
     conn.close()
     
     print(f"Successfully wrote enterprise-grade dataset to: {db_path}")
+    if not ok:
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+# Bump when the cached payload format changes; older versions are simply ignored
+STORE_VERSION = 1
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_STORE_DIR = os.path.join(BASE_DIR, 'output', 'reference_data')
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Reference sources. Each URL may return a JSON list of strings, a list of objects
+# with a `field` key, or an object wrapping such a list under 'items'/'data'.
+# URLs are overridable (and sources without a default enabled) through the environment.
+SOURCES = {
+    'companies': {
+        'urls': [os.environ.get('REFERENCE_COMPANIES_URL', 'https://yc-oss.github.io/api/companies/all.json')],
+        'field': 'name',
+    },
+    'job_titles': {
+        'urls': [u for u in [os.environ.get('REFERENCE_JOB_TITLES_URL')] if u],
+        'field': 'title',
+    },
+    'teams': {
+        'urls': [u for u in [os.environ.get('REFERENCE_TEAMS_URL')] if u],
+        'field': 'name',
+    },
+}
+
+# Minimum seconds between two requests to the same host
+RATE_LIMIT_INTERVAL = float(os.environ.get('REFERENCE_RATE_LIMIT', '0.5'))
+REQUEST_TIMEOUT = 10
+MAX_WORKERS = 4
+
+class _HostRateLimiter:
+    """Spaces out requests per host so concurrent workers stay polite."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_slot = {}
+
+    def wait(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def _new_session():
+    """A requests session whose connection pool is shared by all fetch workers."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=2)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = 'asana-simulation-seed/1.0'
+    return session
+
+def _extract_items(payload, field):
+    """Normalises a fetched JSON payload into a list of non-empty strings."""
+    if isinstance(payload, dict):
+        payload = payload.get('items') or payload.get('data') or []
+    if not isinstance(payload, list):
+        raise ValueError(f"expected a JSON list or object, got {type(payload).__name__}")
+    items = []
+    for entry in payload:
+        value = entry.get(field) if isinstance(entry, dict) else entry
+        if isinstance(value, str) and value.strip():
+            items.append(value.strip())
+    return items
+
+def load_fixture(source):
+    """Reads the bundled offline fixture list for a reference source."""
+    with open(os.path.join(FIXTURES_DIR, f"{source}.json"), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+class ReferenceStore:
+    """Versioned on-disk cache: <store_dir>/v<STORE_VERSION>/<source>.json."""
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR):
+        self.dir = os.path.join(store_dir, f"v{STORE_VERSION}")
+
+    def _path(self, source):
+        return os.path.join(self.dir, f"{source}.json")
+
+    def load(self, source):
+        """Returns the cached record for a source, or None when absent or unreadable."""
+        path = self._path(source)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except json.JSONDecodeError:
+            # A truncated or corrupt file is treated as a cache miss and rewritten on fetch
+            return None
+        return record if isinstance(record, dict) and record.get('version') == STORE_VERSION else None
+
+    def save(self, source, items, urls):
+        os.makedirs(self.dir, exist_ok=True)
+        record = {
+            'version': STORE_VERSION,
+            'source': source,
+            'urls': urls,
+            'fetched_at': datetime.now(timezone.utc).isoformat(),
+            'items': items,
+        }
+        with open(self._path(source), 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2)
+        return record
+
+def fetch_sources(sources, rate_limit=RATE_LIMIT_INTERVAL):
+    """
+    Fetches every URL of the given sources concurrently through one pooled session.
+    Returns {source: items}; sources whose requests all fail are omitted.
+    """
+    limiter = _HostRateLimiter(rate_limit)
+    session = _new_session()
+
+    def fetch(source, url):
+        limiter.wait(url)
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return _extract_items(response.json(), SOURCES[source]['field'])
+
+    results = {}
+    jobs = [(source, url) for source in sources for url in SOURCES[source]['urls']]
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = [(source, url, pool.submit(fetch, source, url)) for source, url in jobs]
+            for source, url, future in futures:
+                try:
+                    results.setdefault(source, []).extend(future.result())
+                except Exception as e:
+                    print(f"Reference fetch failed for {url}, using fixtures: {e}")
+    finally:
+        session.close()
+    # De-duplicate while keeping the source order
+    return {source: list(dict.fromkeys(items)) for source, items in results.items() if items}
+
+def load_reference_data(offline=False, refresh=False, store_dir=DEFAULT_STORE_DIR):
+    """
+    Loads company, job title and team taxonomy reference lists once at startup.
+
+    Cached records are used unless `refresh` is set. Missing sources are fetched over
+    the network, or read from the bundled fixtures when `offline` is set, no URL is
+    configured, or the fetch fails. Generators receive the returned dict and never
+    touch the network.
+
+    Returns:
+        dict: {'companies': [...], 'job_titles': [...], 'teams': [...]}
+    """
+    store = ReferenceStore(store_dir)
+    data, missing = {}, []
+    for source in SOURCES:
+        record = None if refresh else store.load(source)
+        if record and record['items']:
+            data[source] = record['items']
+        else:
+            missing.append(source)
+
+    fetched = {}
+    to_fetch = [s for s in missing if SOURCES[s]['urls']]
+    if to_fetch and not offline:
+        fetched = fetch_sources(to_fetch)
+
+    for source in missing:
+        if source in fetched:
+            data[source] = store.save(source, fetched[source], SOURCES[source]['urls'])['items']
+        else:
+            # Fixtures are never cached, so a later online run still fetches the source
+            data[source] = load_fixture(source)
+    return data
@@ -1,5 +1,5 @@
-import requests
 import random
+from .reference_data import SOURCES, load_fixture, load_reference_data
 
 class SampleScraper:
     """
@@ -7,23 +7,21 @@ class SampleScraper:
     Target sources include public directories like Y Combinator or Crunchbase.
     """
     
-    def __init__(self):
-        # Example: Using a public API or static list for realistic company naming patterns
-        self.base_url = "https://api.example.com/v1/companies" 
-        self.fallback_companies = ["AeroSync", "CloudLayer", "DataPulse", "NexGen SaaS", "Vertex Solutions"]
+    def __init__(self, offline=False):
+        # Company names come from the reference-data store (network, cache or fixtures)
+        self.base_url = SOURCES['companies']['urls'][0]
+        self.offline = offline
 
     def get_realistic_companies(self, count=5):
         """
         Fetches or returns a list of realistic company names to be used as Organization names.
         """
         try:
-            # In a live scenario, you would perform a GET request here
-            # response = requests.get(self.base_url)
-            # names = [item['name'] for item in response.json()]
-            return random.sample(self.fallback_companies, min(count, len(self.fallback_companies)))
+            names = load_reference_data(offline=self.offline)['companies']
+            return random.sample(names, min(count, len(names)))
         except Exception as e:
             print(f"Scraping failed, using fallback patterns: {e}")
-            return self.fallback_companies[:count]
+            return load_fixture('companies')[:count]
 
     def get_industry_benchmarks(self):
         """
@@ -2,7 +2,6 @@ import streamlit as st
 import sqlite3
 import os
 from datetime import datetime
-import pandas as pd
 
 # Default path aligns with the assignment's required output directory [cite: 84, 88]
 DEFAULT_DB = os.environ.get('DATABASE_PATH', 'output/asana_simulation.sqlite')
@@ -93,6 +92,9 @@ if conn is None:
     st.warning(f'Database not found at path: {db_path}. Please run src/main.py first.')
     st.stop()
 
+# pandas is only needed once a database is available to render
+import pandas as pd
+
 # --- Filters ---
 rows = load_projects_teams(conn)
 projects = sorted({(r['project_id'], r['project_name']) for r in rows}, key=lambda x: x[1])
@@ -0,0 +1,11 @@
+"""
+Validators package initialization.
+Exposes the pre-flight schema conformance check and the post-load integrity pass.
+"""
+
+from .integrity import check_generator_inserts, run_integrity_checks
+
+__all__ = [
+    "check_generator_inserts",
+    "run_integrity_checks"
+]
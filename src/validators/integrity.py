@@ -0,0 +1,190 @@
+import os
+import re
+import sqlite3
+
+GENERATORS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'generators')
+
+# Matches the column-listed INSERT statements used throughout the generators
+_INSERT_RE = re.compile(r"INSERT\s+(?:OR\s+\w+\s+)?INTO\s+(\w+)\s*\(([^)]*)\)", re.IGNORECASE)
+# Matches every INSERT statement, so ones the column-list pattern cannot parse are reported
+_ANY_INSERT_RE = re.compile(r"\bINSERT\s+(?:OR\s+\w+\s+)?INTO\b", re.IGNORECASE)
+
+# Row-level rules evaluated in the same pass as the orphan checks. `t` aliases the table
+# and `fk_<column>` the row referenced through that foreign-key column.
+TABLE_CHECKS = {
+    'tasks': [
+        ('completed_at before created_at',
+         "t.completed_at IS NOT NULL AND julianday(t.completed_at) < julianday(t.created_at)"),
+        ('due_date before created_at',
+         "t.due_date IS NOT NULL AND date(t.due_date) < date(t.created_at)"),
+        ('completed without completed_at',
+         "t.completed = 1 AND t.completed_at IS NULL"),
+        ('task created_at in the future',
+         "julianday(t.created_at) > julianday('now')"),
+        ('task created_at before project created_at',
+         "julianday(t.created_at) < julianday(fk_project_id.created_at)"),
+        ('task created_at before assignee created_at',
+         "julianday(t.created_at) < julianday(fk_assignee_id.created_at)"),
+    ],
+    'comments': [
+        ('comment created_at before task created_at',
+         "julianday(t.created_at) < julianday(fk_task_id.created_at)"),
+        ('comment created_at in the future',
+         "julianday(t.created_at) > julianday('now')"),
+        ('comment created_at before author created_at',
+         "julianday(t.created_at) < julianday(fk_user_id.created_at)"),
+    ],
+    'attachments': [
+        ('attachment created_at before task created_at',
+         "julianday(t.created_at) < julianday(fk_task_id.created_at)"),
+        ('attachment created_at in the future',
+         "julianday(t.created_at) > julianday('now')"),
+        ('attachment created_at before uploader created_at',
+         "julianday(t.created_at) < julianday(fk_uploaded_by.created_at)"),
+    ],
+}
+
+# Aggregates collected alongside the checks and compared against industry benchmarks.
+# Rates use top-level tasks only: subtasks are created unassigned and open by design.
+TABLE_METRICS = {
+    'tasks': [
+        ('top_level_tasks', "t.parent_task_id IS NULL"),
+        ('unassigned_tasks', "t.parent_task_id IS NULL AND t.assignee_id IS NULL"),
+        ('completed_tasks', "t.parent_task_id IS NULL AND t.completed = 1"),
+    ],
+}
+
+def _schema_columns(schema_path):
+    """Loads schema.sql into an in-memory database and returns {table: {column: required}}."""
+    mem = sqlite3.connect(':memory:')
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        mem.executescript(f.read())
+    tables = {}
+    for (table,) in mem.execute("SELECT name FROM sqlite_master WHERE type = 'table'"):
+        tables[table] = {
+            # (cid, name, type, notnull, dflt_value, pk)
+            col[1]: bool((col[3] or col[5]) and col[4] is None)
+            for col in mem.execute(f'PRAGMA table_info("{table}")')
+        }
+    mem.close()
+    return tables
+
+def collect_generator_inserts(generators_dir=GENERATORS_DIR):
+    """
+    Statically collects every INSERT statement in the generator modules.
+    Returns a list of (location, table, columns) without importing the generators.
+    Statements without a literal table name and column list (e.g. `INSERT INTO t VALUES`
+    or a table name built at runtime) are returned with table and columns set to None.
+    """
+    inserts = []
+    for name in sorted(os.listdir(generators_dir)):
+        if not name.endswith('.py'):
+            continue
+        path = os.path.join(generators_dir, name)
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        parsed = {m.start(): m for m in _INSERT_RE.finditer(source)}
+        for stmt in _ANY_INSERT_RE.finditer(source):
+            location = f"{name}:{source.count(chr(10), 0, stmt.start()) + 1}"
+            m = parsed.get(stmt.start())
+            if m is None:
+                inserts.append((location, None, None))
+                continue
+            columns = [c.strip() for c in m.group(2).split(',') if c.strip()]
+            inserts.append((location, m.group(1), columns))
+    return inserts
+
+def check_generator_inserts(schema_path, generators_dir=GENERATORS_DIR):
+    """
+    Pre-flight check: verifies every generator INSERT against schema.sql.
+    Reports unknown tables, unknown columns and omitted NOT NULL columns all at once,
+    before any rows are written.
+    """
+    tables = _schema_columns(schema_path)
+    errors = []
+    for location, table, columns in collect_generator_inserts(generators_dir):
+        if table is None:
+            errors.append(f"{location}: INSERT without a literal table name and column list cannot be verified")
+            continue
+        if table not in tables:
+            errors.append(f"{location}: INSERT into unknown table '{table}'")
+            continue
+        known = tables[table]
+        for col in columns:
+            if col not in known:
+                errors.append(f"{location}: unknown column '{table}.{col}'")
+        for col, required in known.items():
+            if required and col not in columns:
+                errors.append(f"{location}: required column '{table}.{col}' not provided")
+    return errors
+
+def _table_pass(conn, table):
+    """
+    Runs one aggregate query over `table` covering every foreign key (orphans),
+    the table's row-level rules and its metrics. Returns ({label: count}, {metric: value}).
+    """
+    joins, checks = [], []
+    for fk in conn.execute(f'PRAGMA foreign_key_list("{table}")').fetchall():
+        # (id, seq, table, from, to, on_update, on_delete, match)
+        ref_table, col, ref_col = fk[2], fk[3], fk[4]
+        alias = f"fk_{col}"
+        joins.append(f'LEFT JOIN "{ref_table}" {alias} ON t."{col}" = {alias}."{ref_col}"')
+        checks.append((f"orphaned {table}.{col} -> {ref_table}.{ref_col}",
+                       f't."{col}" IS NOT NULL AND {alias}."{ref_col}" IS NULL'))
+    checks += TABLE_CHECKS.get(table, [])
+    metrics = TABLE_METRICS.get(table, [])
+
+    exprs = ['COUNT(1)'] + [f"COALESCE(SUM(CASE WHEN {expr} THEN 1 ELSE 0 END), 0)"
+                            for _, expr in checks + metrics]
+    row = conn.execute(f'SELECT {", ".join(exprs)} FROM "{table}" t {" ".join(joins)}').fetchone()
+
+    values = row[1:]
+    violations = {label: n for (label, _), n in zip(checks, values[:len(checks)])}
+    collected = {f"{table}_rows": row[0]}
+    collected.update({name: n for (name, _), n in zip(metrics, values[len(checks):])})
+    return violations, collected
+
+def _check_benchmarks(metrics, benchmarks, tolerance):
+    """Compares generated rates to the industry benchmarks; returns error strings."""
+    errors = []
+    total = metrics.get('top_level_tasks', 0)
+    if not total:
+        return errors
+
+    unassigned = metrics['unassigned_tasks'] / total
+    metrics['unassigned_rate'] = round(unassigned, 4)
+    target = benchmarks.get('avg_unassigned_rate')
+    if target is not None and abs(unassigned - target) > tolerance:
+        errors.append(f"unassigned rate {unassigned:.1%} outside {target:.0%} ± {tolerance:.0%}")
+
+    completion = metrics['completed_tasks'] / total
+    metrics['completion_rate'] = round(completion, 4)
+    # Projects carry no type, so the overall rate must fall within the per-type range
+    targets = [v for k, v in benchmarks.items() if k.endswith('_completion_rate')]
+    if targets and not (min(targets) - tolerance <= completion <= max(targets) + tolerance):
+        errors.append(f"completion rate {completion:.1%} outside "
+                      f"{min(targets):.0%}-{max(targets):.0%} ± {tolerance:.0%}")
+    return errors
+
+def run_integrity_checks(conn: sqlite3.Connection, benchmarks=None, tolerance=0.10):
+    """
+    Post-load validation using set-based SQL: one aggregate pass per table checks
+    orphaned foreign keys, temporal ordering and benchmark metrics together.
+
+    Returns:
+        dict: {'errors': [...], 'metrics': {...}}; the dataset is valid when errors is empty.
+    """
+    if benchmarks is None:
+        from scrapers.sample_scraper import SampleScraper
+        benchmarks = SampleScraper().get_industry_benchmarks()
+
+    errors, metrics = [], {}
+    tables = [r[0] for r in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+    for table in tables:
+        violations, collected = _table_pass(conn, table)
+        metrics.update(collected)
+        errors += [f"{label}: {n} rows" for label, n in violations.items() if n]
+
+    errors += _check_benchmarks(metrics, benchmarks, tolerance)
+    return {'errors': errors, 'metrics': metrics}